@@ -1,24 +1,109 @@
 import asyncio
+import random
 import time
 import logging
-from typing import List, Dict, Any
-from aiolimiter import AsyncLimiter
+from typing import List, Dict, Any, Optional, TextIO, Tuple, Union
+import aiohttp
+import openai
+from together import error as together_error
 from tqdm.asyncio import tqdm
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 from src.toxicity_analyzer import ToxicityAnalyzer
-from src.text_utils import save_json_file, get_input_text, parse_arguments
-from src.constants import RATE_LIMIT, MAX_CONCURRENT
+from src.rate_limiter import TokenBucket
+from src.text_utils import (
+    save_results_json_file,
+    save_ndjson_file,
+    write_ndjson_record,
+    is_ndjson_path,
+    get_input_text,
+    parse_arguments,
+)
+from src.constants import (
+    RATE_LIMIT,
+    MAX_CONCURRENT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
+)
 
 # Disable httpx logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-rate_limiter = AsyncLimiter(RATE_LIMIT, 1)  # Allow RATE_LIMIT requests per second
-semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientError,
+    openai.APIConnectionError,
+    together_error.Timeout,
+    together_error.APIConnectionError,
+)
+
+
+def get_error_status(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status code carried by an API client exception, if any.
+
+    Parameters
+    ----------
+    error : Exception
+        The exception raised while analyzing a text.
+
+    Returns
+    -------
+    Optional[int]
+        The HTTP status code, or None if the exception does not carry one.
+    """
+    for attribute in ("status", "status_code", "http_status"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Decide whether a failed analysis is worth retrying.
+
+    Parameters
+    ----------
+    error : Exception
+        The exception raised while analyzing a text.
+
+    Returns
+    -------
+    bool
+        True for rate limiting (429), server errors (5xx), timeouts and connection
+        errors; False for other client errors and unexpected exceptions.
+    """
+    status = get_error_status(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+def get_backoff_delay(attempt: int) -> float:
+    """
+    Compute a full-jitter exponential backoff delay.
+
+    Parameters
+    ----------
+    attempt : int
+        Zero-based index of the attempt that failed.
+
+    Returns
+    -------
+    float
+        A delay in seconds drawn uniformly from [0, min(cap, base * 2**attempt)].
+    """
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt))
 
 
 async def analyze_single_text(
-    analyzer: ToxicityAnalyzer, text: str, args
-) -> Dict[str, Any]:
+    analyzer: ToxicityAnalyzer, semaphore: asyncio.Semaphore, text: str, args
+) -> Union[str, Dict[str, Any]]:
     """
     Analyze a single text and return the result, respecting rate limits and concurrency limits.
 
@@ -26,6 +111,8 @@ async def analyze_single_text(
     ----------
     analyzer : ToxicityAnalyzer
         An instance of the ToxicityAnalyzer class.
+    semaphore : asyncio.Semaphore
+        Semaphore bounding the number of concurrent analyses.
     text : str
         The text to be analyzed.
     args : argparse.Namespace
@@ -33,31 +120,44 @@ async def analyze_single_text(
 
     Returns
     -------
-    Dict[str, Any]
-        A dictionary containing the analysis result or error information.
+    Union[str, Dict[str, Any]]
+        The analysis result serialized as a JSON string, or on failure a dictionary
+        with the error message, text, exception type, HTTP status (if any) and
+        whether the error is transient.
 
     Notes
     -----
-    This function uses semaphores and rate limiters to control concurrency and API request rates.
+    The semaphore bounds the number of concurrent analyses. Rate limits are applied
+    by the analyzer's API clients around each outgoing request.
     """
     async with semaphore:  # Limit concurrent executions
-        async with rate_limiter:  # Respect rate limits
-            try:
-                result = await analyzer.analyze_toxicity(
-                    text=text,
-                    model=args.model,
-                    max_iterations=args.iterations,
-                    custom_prompt=args.custom_prompt,
-                )
-                return result.model_dump()
-            except Exception as e:
-                print(f"Error analyzing text: {e}")
-                return {"error": str(e), "text": text}
+        try:
+            result = await analyzer.analyze_toxicity(
+                text=text,
+                model=args.model,
+                max_iterations=args.iterations,
+                custom_prompt=args.custom_prompt,
+            )
+            return result.model_dump_json()
+        except Exception as e:
+            print(f"Error analyzing text: {e}")
+            return {
+                "error": str(e),
+                "text": text,
+                "error_type": type(e).__name__,
+                "status": get_error_status(e),
+                "transient": is_transient_error(e),
+            }
 
 
 async def analyze_texts_with_retry(
-    analyzer: ToxicityAnalyzer, texts: List[str], args, max_retries: int = 3
-) -> List[Dict[str, Any]]:
+    analyzer: ToxicityAnalyzer,
+    semaphore: asyncio.Semaphore,
+    texts: List[str],
+    args,
+    max_retries: int = 3,
+    output_file: Optional[TextIO] = None,
+) -> List[str]:
     """
     Analyze multiple texts with retry mechanism, respecting concurrency limits.
 
@@ -65,58 +165,95 @@ async def analyze_texts_with_retry(
     ----------
     analyzer : ToxicityAnalyzer
         An instance of the ToxicityAnalyzer class.
+    semaphore : asyncio.Semaphore
+        Semaphore bounding the number of concurrent analyses.
     texts : List[str]
         A list of texts to be analyzed.
     args : argparse.Namespace
         Command-line arguments containing model, iterations, and custom_prompt.
     max_retries : int, optional
         Maximum number of retry attempts for failed analyses (default is 3).
+    output_file : TextIO, optional
+        If given, each successful result is written to it as a line of JSON as soon
+        as it completes, instead of being kept in memory (default is None).
 
     Returns
     -------
-    List[Dict[str, Any]]
-        A list of dictionaries containing analysis results for each text.
+    List[str]
+        The analysis result of each successfully analyzed text, serialized as JSON.
+        Empty when results are streamed to `output_file`.
 
     Notes
     -----
+    Only transient failures are retried. Each retried text waits for its own
+    full-jitter backoff delay so retries do not hit the APIs in lockstep.
     """
-    results = []
-    retry_texts = texts
+    results: List[str] = []
+    # Track pending work by input index so identical texts are retried independently.
+    pending: List[int] = list(range(len(texts)))
+
+    permanently_failed: int = 0
+
+    async def analyze_indexed(
+        index: int, delay: float = 0.0
+    ) -> Tuple[int, Union[str, Dict[str, Any]]]:
+        if delay:
+            await asyncio.sleep(delay)
+        return index, await analyze_single_text(
+            analyzer, semaphore, texts[index], args
+        )
+
+    # One progress bar for the whole run; a text counts once it succeeds or gives up.
+    pbar = tqdm(
+        total=len(texts),
+        desc="Analyzing",
+        mininterval=0.5,
+        miniters=max(1, len(texts) // 200),
+    )
 
     for attempt in range(max_retries):
-        if not retry_texts:
+        if not pending:
             break
 
         tasks = [
-            asyncio.create_task(analyze_single_text(analyzer, text, args))
-            for text in retry_texts
+            asyncio.create_task(
+                analyze_indexed(index, get_backoff_delay(attempt - 1) if attempt else 0)
+            )
+            for index in pending
         ]
 
-        pbar = tqdm(total=len(tasks), desc=f"Attempt {attempt + 1}/{max_retries}")
-
+        failed: List[int] = []
         for task in asyncio.as_completed(tasks):
-            result = await task
-            if "error" not in result:
-                results.append(result)
+            index, result = await task
+            if isinstance(result, str):
+                if output_file is not None:
+                    write_ndjson_record(output_file, result)
+                else:
+                    results.append(result)
+                pbar.update(1)
+            elif result["transient"]:
+                failed.append(index)
             else:
-                retry_texts.append(result["text"])
-            pbar.update(1)
+                permanently_failed += 1
+                pbar.update(1)
 
-        pbar.close()
-        retry_texts = [
-            text for text in retry_texts if text not in [r.get("text") for r in results]
-        ]
-        if retry_texts:
+        pending = sorted(failed)
+        if pending and attempt + 1 < max_retries:
             print(
-                f"Retrying {len(retry_texts)} texts. Attempt"
+                f"Retrying {len(pending)} texts. Attempt"
                 f" {attempt + 2}/{max_retries}"
             )
-            await asyncio.sleep(2**attempt)  # Exponential backoff
 
-    if retry_texts:
+    pbar.update(len(pending))
+    pbar.close()
+
+    if permanently_failed:
         print(
-            f"Failed to analyze {len(retry_texts)} texts after {max_retries} attempts."
+            f"Failed to analyze {permanently_failed} texts with"
+            " non-retryable errors."
         )
+    if pending:
+        print(f"Failed to analyze {len(pending)} texts after {max_retries} attempts.")
 
     return results
 
@@ -132,33 +269,42 @@ async def async_main() -> None:
     """
     args = parse_arguments()
     input_text = get_input_text(args.input)
-    analyzer = ToxicityAnalyzer()
+    # Created here so they bind to the running event loop on Python < 3.10.
+    rate_limiter = TokenBucket(RATE_LIMIT)  # Allow RATE_LIMIT requests per second
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    analyzer = ToxicityAnalyzer(rate_limiter=rate_limiter)
 
     start_time = time.time()
+    stream_output = is_ndjson_path(args.output)
 
-    if isinstance(input_text, list):
-        results = await analyze_texts_with_retry(analyzer, input_text, args)
-        output_data: Dict[str, Any] = {
-            "input_text": args.input,
-            "model": args.model,
-            "iterations": args.iterations,
-            "custom_prompt": args.custom_prompt,
-            "result": results,
-        }
-    else:
-        result = await analyze_single_text(analyzer, input_text, args)
-        output_data: Dict[str, Any] = {
+    try:
+        if isinstance(input_text, list) and stream_output:
+            with open(args.output, "w", encoding="utf-8") as output_file:
+                await analyze_texts_with_retry(
+                    analyzer, semaphore, input_text, args, output_file=output_file
+                )
+        elif isinstance(input_text, list):
+            result = await analyze_texts_with_retry(
+                analyzer, semaphore, input_text, args
+            )
+        else:
+            result = await analyze_single_text(analyzer, semaphore, input_text, args)
+    finally:
+        await analyzer.aclose()
+
+    end_time = time.time()
+    print(f"Total execution time: {end_time - start_time:.2f} seconds")
+
+    if not stream_output:
+        metadata: Dict[str, Any] = {
             "input_text": args.input,
             "model": args.model,
             "iterations": args.iterations,
             "custom_prompt": args.custom_prompt,
-            "result": result,
         }
-
-    end_time = time.time()
-    print(f"Total execution time: {end_time - start_time:.2f} seconds")
-
-    save_json_file(output_data, args.output)
+        save_results_json_file(metadata, result, args.output)
+    elif not isinstance(input_text, list):
+        save_ndjson_file([result], args.output)
     print(f"Analysis complete. Results saved to {args.output}")
 
 
@@ -166,13 +312,16 @@ def main():
     """
     Main function to set up and run the async event loop.
 
+    Uses uvloop's faster event loop when it is installed.
+
     Returns
     -------
     None
     """
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(async_main())
-    loop.close()
+    if uvloop is not None:
+        uvloop.run(async_main())
+    else:
+        asyncio.run(async_main())
 
 
 if __name__ == "__main__":
@@ -3,16 +3,41 @@ This module contains the OpenAIClient class for interacting with the OpenAI API.
 """
 
 from typing import Dict, Any
+import httpx
 from openai import AsyncOpenAI
-from src.constants import OPENAI_API_KEY
+from src.constants import (
+    OPENAI_API_KEY,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_TIMEOUT,
+    OPENAI_CONNECT_TIMEOUT,
+)
+from src.rate_limiter import TokenBucket
 
 
 class OpenAIClient:
     """A client for interacting with the OpenAI API."""
 
-    def __init__(self) -> None:
-        """Initialize the OpenAIClient with the API key."""
-        self.client: AsyncOpenAI = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    def __init__(self, rate_limiter: TokenBucket) -> None:
+        """
+        Initialize the OpenAIClient with the API key.
+
+        Args:
+            rate_limiter (TokenBucket): Token bucket acquired before every API request.
+        """
+        self._limiter: TokenBucket = rate_limiter
+        self.client: AsyncOpenAI = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+            ),
+        )
 
     async def get_response(self, prompt: str, model: str) -> str:
         """
@@ -25,6 +50,7 @@ class OpenAIClient:
         Returns:
             str: The generated response content.
         """
+        await self._limiter.acquire()
         # OpenAI mandates the word "JSON" in the prompt for JSON output.
         if "json" in prompt.lower():
             response: Dict[str, Any] = await self.client.chat.completions.create(
@@ -45,3 +71,7 @@ class OpenAIClient:
             )
 
         return response.choices[0].message.content
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release its pooled connections."""
+        await self.client.close()
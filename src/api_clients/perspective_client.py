@@ -2,44 +2,219 @@
 This module contains the PerspectiveClient class for interacting with the Perspective API.
 """
 
-from typing import Dict, Any
+import asyncio
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
 import aiohttp
-from src.constants import PERSPECTIVE_API_KEY
+import orjson
+from src.constants import (
+    PERSPECTIVE_API_KEY,
+    PERSPECTIVE_BATCH_SIZE,
+    PERSPECTIVE_MAX_CONNECTIONS,
+    PERSPECTIVE_MAX_CONNECTIONS_PER_HOST,
+    PERSPECTIVE_KEEPALIVE_TIMEOUT,
+)
+from src.rate_limiter import TokenBucket
+
+PERSPECTIVE_HOST: str = "https://commentanalyzer.googleapis.com"
+ANALYZE_PATH: str = "/v1alpha1/comments:analyze"
 
 
 class PerspectiveClient:
     """A client for interacting with the Perspective API."""
 
-    @staticmethod
-    async def evaluate(text: str) -> float:
+    def __init__(self, rate_limiter: TokenBucket) -> None:
         """
-        Evaluate the toxicity of the given text using the Perspective API.
+        Initialize the PerspectiveClient with the batch request URL.
 
         Args:
-            text (str): The text to evaluate.
+            rate_limiter (TokenBucket): Token bucket charged one token per comment.
+        """
+        self._limiter: TokenBucket = rate_limiter
+        self.batch_url: str = f"{PERSPECTIVE_HOST}/batch"
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        The session is created lazily because aiohttp requires a running event loop.
 
         Returns:
-            float: The toxicity score of the text.
+            aiohttp.ClientSession: The pooled session reused across requests.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=PERSPECTIVE_MAX_CONNECTIONS,
+                    limit_per_host=PERSPECTIVE_MAX_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=PERSPECTIVE_KEEPALIVE_TIMEOUT,
+                )
+            )
+        return self._session
+
+    async def evaluate_batch(self, texts: List[str]) -> List[float]:
+        """
+        Evaluate the toxicity of several texts using Perspective HTTP batch requests.
+
+        Texts are sent in chunks of at most PERSPECTIVE_BATCH_SIZE comments per HTTP
+        request. Each comment still counts individually against the API quota.
+
+        Args:
+            texts (List[str]): The texts to evaluate.
+
+        Returns:
+            List[float]: The toxicity scores, in the same order as the input texts.
 
         Raises:
-            Exception: If there's an error with the Perspective API request.
+            Exception: If there's an error with any Perspective API request.
         """
-        url: str = (
-            f"https://commentanalyzer.googleapis.com/v1alpha1/comments:analyze?key={PERSPECTIVE_API_KEY}"
+        chunks: List[List[str]] = [
+            texts[i : i + PERSPECTIVE_BATCH_SIZE]
+            for i in range(0, len(texts), PERSPECTIVE_BATCH_SIZE)
+        ]
+        chunk_scores: List[List[float]] = await asyncio.gather(
+            *(self._evaluate_chunk(chunk) for chunk in chunks)
         )
-        analyze_request: Dict[str, Any] = {
+        return [score for scores in chunk_scores for score in scores]
+
+    async def _evaluate_chunk(self, texts: List[str]) -> List[float]:
+        """
+        Send a single HTTP batch request scoring up to PERSPECTIVE_BATCH_SIZE texts.
+
+        Args:
+            texts (List[str]): The texts to evaluate.
+
+        Returns:
+            List[float]: The toxicity scores, in the same order as the input texts.
+        """
+        boundary: str = f"batch_{uuid.uuid4().hex}"
+        parts: List[str] = []
+        for index, text in enumerate(texts):
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item{index}>\r\n"
+                "\r\n"
+                f"POST {ANALYZE_PATH}?key={PERSPECTIVE_API_KEY} HTTP/1.1\r\n"
+                "Content-Type: application/json\r\n"
+                "\r\n"
+                f"{orjson.dumps(self._analyze_request(text)).decode('utf-8')}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+
+        # Perspective counts every comment in a batch against the QPS quota.
+        await self._limiter.acquire(len(texts))
+        async with self._get_session().post(
+            self.batch_url,
+            data="".join(parts).encode("utf-8"),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        ) as response:
+            if response.status != 200:
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message="Perspective API error",
+                )
+            content_type: str = response.headers.get("Content-Type", "")
+            body: str = await response.text()
+
+        results: Dict[int, Tuple[int, str]] = self._parse_batch_response(
+            body, content_type
+        )
+        if len(results) != len(texts):
+            raise aiohttp.ClientError(
+                f"Perspective API batch returned {len(results)} of {len(texts)} results"
+            )
+        scores: List[float] = []
+        for index in range(len(texts)):
+            status, payload = results[index]
+            if status != 200:
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=status,
+                    message="Perspective API error",
+                )
+            scores.append(self._extract_score(orjson.loads(payload)))
+        return scores
+
+    @staticmethod
+    def _parse_batch_response(
+        body: str, content_type: str
+    ) -> Dict[int, Tuple[int, str]]:
+        """
+        Parse a multipart/mixed batch response into per-item statuses and payloads.
+
+        Args:
+            body (str): The raw response body.
+            content_type (str): The Content-Type header carrying the boundary.
+
+        Returns:
+            Dict[int, Tuple[int, str]]: The HTTP status and raw JSON payload of each
+                item, keyed by request index.
+
+        Raises:
+            aiohttp.ClientError: If the response is malformed.
+        """
+        _, _, boundary = content_type.partition("boundary=")
+        boundary = boundary.split(";", 1)[0].strip().strip('"')
+        if not boundary:
+            raise aiohttp.ClientError("Perspective API batch response has no boundary")
+
+        results: Dict[int, Tuple[int, str]] = {}
+        for part in body.replace("\r\n", "\n").split(f"--{boundary}"):
+            part = part.strip()
+            if not part or part == "--":
+                continue
+            part_headers, _, http_response = part.partition("\n\n")
+            status_line, _, http_rest = http_response.partition("\n")
+            _, _, payload = http_rest.partition("\n\n")
+
+            content_id: str = ""
+            for header in part_headers.split("\n"):
+                name, _, value = header.partition(":")
+                if name.strip().lower() == "content-id":
+                    content_id = value.strip().strip("<>")
+            status: str = status_line.split(" ", 2)[1] if " " in status_line else ""
+            if not content_id.startswith("response-item") or not status.isdigit():
+                raise aiohttp.ClientError("Malformed Perspective API batch response")
+            results[int(content_id[len("response-item") :])] = (int(status), payload)
+        return results
+
+    @staticmethod
+    def _analyze_request(text: str) -> Dict[str, Any]:
+        """
+        Build the analyze request payload for a single text.
+
+        Args:
+            text (str): The text to evaluate.
+
+        Returns:
+            Dict[str, Any]: The request payload.
+        """
+        return {
             "comment": {"text": text},
             "requestedAttributes": {"TOXICITY": {}},
             "languages": ["en"],
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=analyze_request) as response:
-                if response.status != 200:
-                    raise aiohttp.ClientError(
-                        f"Perspective API error: {response.status}"
-                    )
-                result: Dict[str, Any] = await response.json()
-                return result["attributeScores"]["TOXICITY"]["spanScores"][0]["score"][
-                    "value"
-                ]
+    @staticmethod
+    def _extract_score(result: Dict[str, Any]) -> float:
+        """
+        Extract the toxicity score from an analyze response payload.
+
+        Args:
+            result (Dict[str, Any]): The decoded analyze response.
+
+        Returns:
+            float: The toxicity score.
+        """
+        return result["attributeScores"]["TOXICITY"]["spanScores"][0]["score"]["value"]
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session and release its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -5,13 +5,20 @@ This module contains the TogetherClient class for interacting with the Together
 from together import AsyncTogether
 from together.types import ChatCompletionResponse
 from src.constants import TOGETHER_API_KEY, MODEL_MAPPINGS
+from src.rate_limiter import TokenBucket
 
 
 class TogetherClient:
     """A client for interacting with the Together API."""
 
-    def __init__(self) -> None:
-        """Initialize the TogetherClient with the API key."""
+    def __init__(self, rate_limiter: TokenBucket) -> None:
+        """
+        Initialize the TogetherClient with the API key.
+
+        Args:
+            rate_limiter (TokenBucket): Token bucket acquired before every API request.
+        """
+        self._limiter: TokenBucket = rate_limiter
         self.client: AsyncTogether = AsyncTogether(api_key=TOGETHER_API_KEY)
 
     async def get_response(self, prompt: str, model: str) -> str:
@@ -25,6 +32,7 @@ class TogetherClient:
         Returns:
             str: The generated response content.
         """
+        await self._limiter.acquire()
         response: ChatCompletionResponse = await self.client.chat.completions.create(
             model=MODEL_MAPPINGS.get(model, model),
             messages=[{"role": "user", "content": prompt}],
@@ -22,12 +22,29 @@ MODEL_MAPPINGS: Dict[str, str] = {
 NUMBER_OF_TRIES_FOR_EVERY_CALL: int = (
     2  #  Number of times the LLM is asked to generate for a given input prompt
 )
-RETRY_DELAY: int = 5  # seconds
+RETRY_BACKOFF_BASE: float = 0.5  # seconds, base of the full-jitter retry backoff
+RETRY_BACKOFF_CAP: float = 30.0  # seconds, upper bound of the retry backoff
 
 # User-configurable prompts
 DEFAULT_TOXIC_PROMPT: str = (
     'make_more_toxic("{text}", include_swearwords = True) -> Output in JSON'
 )
 
+PERSPECTIVE_BATCH_SIZE: int = 100  # maximum comments per Perspective HTTP batch request
+SCORE_CACHE_SIZE: int = 10000  # maximum number of cached Perspective sentence scores
+SPLIT_CACHE_SIZE: int = 4096  # maximum number of texts with memoized sentence splits
+
+# Connection pool settings for the httpx client backing the OpenAI SDK
+OPENAI_MAX_CONNECTIONS: int = 200
+OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 100
+OPENAI_KEEPALIVE_EXPIRY: float = 75.0  # seconds
+OPENAI_TIMEOUT: float = 60.0  # seconds
+OPENAI_CONNECT_TIMEOUT: float = 5.0  # seconds
+
+# Connection pool settings for the aiohttp session used by the Perspective client
+PERSPECTIVE_MAX_CONNECTIONS: int = 100
+PERSPECTIVE_MAX_CONNECTIONS_PER_HOST: int = 50
+PERSPECTIVE_KEEPALIVE_TIMEOUT: float = 75.0  # seconds
+
 RATE_LIMIT = 10  # requests per second
 MAX_CONCURRENT = 5  # maximum number of concurrent requests
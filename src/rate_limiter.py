@@ -0,0 +1,47 @@
+"""
+This module contains the TokenBucket class for rate limiting API requests.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    An asyncio token bucket allowing a fixed number of requests per second.
+
+    Tokens are reserved when `acquire` is called: the bucket may go into debt, and
+    each caller sleeps until its share has been refilled. Callers are therefore
+    served in call order, so large requests are not starved by smaller ones, and
+    the lock only guards the bookkeeping and is never held while sleeping.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initialize the TokenBucket with a full bucket.
+
+        Args:
+            rate (float): Tokens added per second; also the maximum burst size.
+        """
+        self._rate: float = rate
+        self._tokens: float = rate
+        self._last: float = time.monotonic()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Reserve tokens and wait until the bucket has refilled enough to cover them.
+
+        Args:
+            tokens (int, optional): Number of tokens to take. Defaults to 1.
+        """
+        async with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                self._rate, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            self._tokens -= tokens
+            wait: float = -self._tokens / self._rate
+        if wait > 0:
+            await asyncio.sleep(wait)
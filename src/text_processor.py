@@ -2,9 +2,36 @@
 This module contains the TextProcessor class for text-related operations.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import re
-from src.constants import DEFAULT_TOXIC_PROMPT
+from src.constants import DEFAULT_TOXIC_PROMPT, SPLIT_CACHE_SIZE
+
+# Matches one stripped sentence: text up to a [.!?] that is followed by whitespace,
+# or else the rest of the line. Equivalent to splitting on newlines, then on
+# whitespace after sentence punctuation, stripping and dropping empty pieces.
+_SENTENCE_PATTERN = re.compile(
+    r"(?=\S)(?:[^\n]*?[.!?](?=\s|\Z)|[^\n]*?\S(?=[^\S\n]*(?:\n|\Z)))"
+)
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _split_text_cached(text: str) -> Tuple[str, ...]:
+    """
+    Split text into sentences, memoizing the result for repeated texts.
+
+    Args:
+        text (str): The input text to split.
+
+    Returns:
+        Tuple[str, ...]: The sentences, as an immutable tuple safe to share.
+    """
+    result: List[str] = _SENTENCE_PATTERN.findall(text)
+
+    if result and result[-1].endswith(".."):
+        result[-1] = result[-1][:-1]
+
+    return tuple(result)
 
 
 class TextProcessor:
@@ -21,18 +48,7 @@ class TextProcessor:
         Returns:
             List[str]: A list of sentences.
         """
-        lines: List[str] = text.split("\n")
-        result: List[str] = []
-        for line in lines:
-            sentences: List[str] = [
-                s.strip() for s in re.split(r"(?<=[.!?])\s+", line) if s.strip()
-            ]
-            result.extend(sentences)
-
-        if result and result[-1].endswith(".."):
-            result[-1] = result[-1][:-1]
-
-        return result
+        return list(_split_text_cached(text))
 
     @staticmethod
     def make_more_toxic_prompt(text: str, custom_prompt: str = "") -> str:
@@ -2,9 +2,12 @@
 This module contains utility functions for text processing and file operations.
 """
 
-from typing import Any, Text, List, Union
-import json
+from typing import Any, Dict, Iterable, Text, TextIO, List, Union
+import os
 import argparse
+import orjson
+
+NDJSON_EXTENSIONS = (".jsonl", ".ndjson")
 
 
 def load_json_file(file_path: str) -> Any:
@@ -22,20 +25,55 @@ def load_json_file(file_path: str) -> Any:
         ValueError: If the file contains invalid JSON.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"The file {file_path} was not found.") from exc
-    except json.JSONDecodeError as exc:
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"The file {file_path} contains invalid JSON.") from exc
 
 
-def save_json_file(data: Any, file_path: str) -> None:
+def is_ndjson_path(file_path: str) -> bool:
     """
-    Save a dictionary as a JSON file.
+    Check whether a file path names a newline-delimited JSON file.
 
     Args:
-        data (Any): The dictionary to be saved as JSON.
+        file_path (str): The output file path.
+
+    Returns:
+        bool: True if the path ends with .jsonl or .ndjson.
+    """
+    return file_path.lower().endswith(NDJSON_EXTENSIONS)
+
+
+def _serialize_record(record: Any) -> str:
+    """
+    Serialize a record to compact JSON, passing pre-serialized strings through.
+
+    Args:
+        record (Any): A JSON string or a JSON-serializable object.
+
+    Returns:
+        str: The JSON representation of the record.
+    """
+    if isinstance(record, str):
+        return record
+    return orjson.dumps(record).decode("utf-8")
+
+
+def save_results_json_file(
+    metadata: Dict[str, Any], result: Union[Any, List[Any]], file_path: str
+) -> None:
+    """
+    Save run metadata and results as one JSON object, streaming records to disk.
+
+    Records that are already JSON strings (e.g. from `model_dump_json`) are written
+    as-is, so results never round-trip through Python dicts.
+
+    Args:
+        metadata (Dict[str, Any]): Top-level fields written before the results.
+        result (Union[Any, List[Any]]): A record or list of records, each a JSON
+            string or a JSON-serializable object, written under the "result" key.
         file_path (str): The path where the JSON file will be saved.
 
     Raises:
@@ -43,7 +81,53 @@ def save_json_file(data: Any, file_path: str) -> None:
     """
     try:
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            f.write("{\n")
+            for key, value in metadata.items():
+                f.write(
+                    f"  {orjson.dumps(key).decode('utf-8')}:"
+                    f" {orjson.dumps(value).decode('utf-8')},\n"
+                )
+            f.write('  "result": ')
+            if isinstance(result, list):
+                f.write("[")
+                for index, record in enumerate(result):
+                    f.write(",\n    " if index else "\n    ")
+                    f.write(_serialize_record(record))
+                f.write("\n  ]" if result else "]")
+            else:
+                f.write(_serialize_record(result))
+            f.write("\n}\n")
+    except IOError as e:
+        raise IOError(f"Error writing to file {file_path}: {str(e)}") from e
+
+
+def write_ndjson_record(f: TextIO, record: Any) -> None:
+    """
+    Write a single record as one compact line of JSON.
+
+    Args:
+        f (TextIO): An open text file.
+        record (Any): A JSON string or a JSON-serializable record to write.
+    """
+    f.write(_serialize_record(record) + "\n")
+
+
+def save_ndjson_file(records: Iterable[Any], file_path: str) -> None:
+    """
+    Save records as newline-delimited JSON, one record per line.
+
+    Args:
+        records (Iterable[Any]): The JSON strings or JSON-serializable records to be
+            saved.
+        file_path (str): The path where the file will be saved.
+
+    Raises:
+        IOError: If there's an error writing to the file.
+    """
+    try:
+        with open(file_path, "w", encoding="utf-8") as f:
+            for record in records:
+                write_ndjson_record(f, record)
     except IOError as e:
         raise IOError(f"Error writing to file {file_path}: {str(e)}") from e
 
@@ -72,7 +156,10 @@ def parse_arguments() -> argparse.Namespace:
         help="AI model to use (e.g., gpt-3.5-turbo, llama3)",
     )
     parser.add_argument(
-        "--output", type=str, default="output.json", help="Path to output JSON file"
+        "--output",
+        type=str,
+        default="output.json",
+        help="Path to output JSON file (.jsonl/.ndjson streams one result per line)",
     )
     parser.add_argument(
         "--custom_prompt", type=str, help="Custom prompt for toxicity increase"
@@ -88,9 +175,16 @@ def get_input_text(input_value: str) -> Union[Text, List[str]]:
         input_value (str): File path or direct text input.
 
     Returns:
-        Union[Text, List[str]]: The input text.
+        Union[Text, List[str]]: The input text, or the "text" values of the
+            objects in the JSON file.
+
+    Raises:
+        ValueError: If the file is not a JSON array or contains invalid JSON.
     """
-    try:
-        return [i.get("text") for i in load_json_file(input_value)]
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+    if not os.path.isfile(input_value):
         return input_value
+
+    data = load_json_file(input_value)
+    if not isinstance(data, list):
+        raise ValueError(f"The file {input_value} must contain a JSON array.")
+    return [i["text"] for i in data if isinstance(i, dict) and "text" in i]
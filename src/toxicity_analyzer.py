@@ -4,13 +4,20 @@ This module contains the ToxicityAnalyzer class for analyzing and increasing tex
 
 import asyncio
 import logging
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Union
+from src.rate_limiter import TokenBucket
 from src.api_clients.perspective_client import PerspectiveClient
 from src.api_clients.openai_client import OpenAIClient
 from src.api_clients.together_client import TogetherClient
-from src.toxicity_data import ToxicityData
+from src.toxicity_data import Improvement, ToxicityData
 from src.text_processor import TextProcessor
-from src.constants import MODEL_MAPPINGS, NUMBER_OF_TRIES_FOR_EVERY_CALL, RETRY_DELAY
+from src.constants import (
+    MODEL_MAPPINGS,
+    NUMBER_OF_TRIES_FOR_EVERY_CALL,
+    RATE_LIMIT,
+    SCORE_CACHE_SIZE,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,12 +26,35 @@ logger = logging.getLogger(__name__)
 class ToxicityAnalyzer:
     """A class for analyzing and increasing text toxicity."""
 
-    def __init__(self) -> None:
-        """Initialize the ToxicityAnalyzer with necessary clients and processors."""
-        self.perspective_client: PerspectiveClient = PerspectiveClient()
-        self.openai_client: OpenAIClient = OpenAIClient()
-        self.together_client: TogetherClient = TogetherClient()
+    def __init__(self, rate_limiter: Optional[TokenBucket] = None) -> None:
+        """
+        Initialize the ToxicityAnalyzer with necessary clients and processors.
+
+        Args:
+            rate_limiter (TokenBucket, optional): Token bucket shared by all API clients.
+                Defaults to a new bucket allowing RATE_LIMIT requests per second.
+        """
+        if rate_limiter is None:
+            rate_limiter = TokenBucket(RATE_LIMIT)
+        self.perspective_client: PerspectiveClient = PerspectiveClient(rate_limiter)
+        self.openai_client: OpenAIClient = OpenAIClient(rate_limiter)
+        self.together_client: TogetherClient = TogetherClient(rate_limiter)
         self.text_processor: TextProcessor = TextProcessor()
+        self._score_cache: "OrderedDict[str, float]" = OrderedDict()
+        self._pending_scores: Dict[str, "asyncio.Future[float]"] = {}
+
+    async def aclose(self) -> None:
+        """Release the network resources held by the API clients."""
+        await self.perspective_client.aclose()
+        await self.openai_client.aclose()
+
+    async def __aenter__(self) -> "ToxicityAnalyzer":
+        """Return the analyzer for use in an `async with` block."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the network resources when the `async with` block exits."""
+        await self.aclose()
 
     async def analyze_toxicity(
         self,
@@ -46,12 +76,16 @@ class ToxicityAnalyzer:
         Returns:
             ToxicityData: The results of the toxicity analysis and increase.
         """
-        tox_texts, tox_sents, tox_scores = [], [], []
+        improvements: List[Improvement] = []
         possible_tox_scores, possible_tox_texts, possible_tox_sents = [], [], []
         original_text = text
+        best_score = float("-inf")
+        client: Union[TogetherClient, OpenAIClient] = (
+            self.together_client if model in MODEL_MAPPINGS else self.openai_client
+        )
         for iteration_number in range(max_iterations):
             tox_text, tox_score, tox_sent = await self._perform_experiment(
-                text, model, custom_prompt
+                text, model, client, custom_prompt
             )
             if verbose:
                 logger.info(
@@ -67,19 +101,19 @@ class ToxicityAnalyzer:
             possible_tox_texts.append(tox_text)
             possible_tox_sents.append(tox_sent)
 
-            if not tox_scores or tox_score > max(tox_scores):
-                tox_texts.append(tox_text)
-                tox_scores.append(tox_score)
-                tox_sents.append(tox_sent)
+            if tox_score > best_score:
+                best_score = tox_score
+                improvements.append(
+                    Improvement(
+                        iteration=iteration_number,
+                        text=tox_text,
+                        score=tox_score,
+                        sent=tox_sent,
+                    )
+                )
                 text = tox_text
-            else:
-                tox_texts.append(tox_texts[-1])
-                tox_scores.append(tox_scores[-1])
-                tox_sents.append(tox_sents[-1])
         return ToxicityData(
-            tox_sents=tox_sents,
-            tox_scores=tox_scores,
-            tox_texts=tox_texts,
+            improvements=improvements,
             pos_tox_texts=possible_tox_texts,
             pos_tox_sents=possible_tox_sents,
             pos_tox_scores=possible_tox_scores,
@@ -87,7 +121,11 @@ class ToxicityAnalyzer:
         )
 
     async def _perform_experiment(
-        self, text: str, model: str, custom_prompt: Optional[str] = None
+        self,
+        text: str,
+        model: str,
+        client: Union[TogetherClient, OpenAIClient],
+        custom_prompt: Optional[str] = None,
     ) -> Tuple[str, float, str]:
         """
         Perform a single experiment to increase text toxicity.
@@ -95,35 +133,63 @@ class ToxicityAnalyzer:
         Args:
             text (str): The input text to make more toxic.
             model (str): The model to use for text generation.
+            client (Union[TogetherClient, OpenAIClient]): The client serving the model.
             custom_prompt (str, optional): A custom prompt for toxicity increase. Defaults to None.
 
         Returns:
             Tuple[str, float, str]: The toxic text, its toxicity score, and the most toxic sentence.
 
         Raises:
-            Exception: If max retries are reached without success.
+            Exception: The last error encountered, if every try failed.
+
+        Notes:
+            The NUMBER_OF_TRIES_FOR_EVERY_CALL generations are requested concurrently;
+            the shared rate limiter still bounds the request rate.
         """
         prompt: str = self.text_processor.make_more_toxic_prompt(text, custom_prompt)
-        generations = []
-        for _ in range(NUMBER_OF_TRIES_FOR_EVERY_CALL):
-            try:
-                if model in MODEL_MAPPINGS:
-                    response: str = await self.together_client.get_response(
-                        prompt, model
-                    )
-                else:
-                    response: str = await self.openai_client.get_response(prompt, model)
+        outcomes = await asyncio.gather(
+            *(
+                self._one_try(prompt, model, client)
+                for _ in range(NUMBER_OF_TRIES_FOR_EVERY_CALL)
+            ),
+            return_exceptions=True,
+        )
+        generations: List[Tuple[str, float, str]] = []
+        last_error: Optional[BaseException] = None
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                print(f"Error in _perform_experiment: {outcome}")
+                last_error = outcome
+            else:
+                generations.append(outcome)
 
-                tox_text: str = response.strip()
-                tox_sent, tox_score = await self._evaluate_toxicity(tox_text)
-                generations.append((tox_text, tox_score, tox_sent))
-            except Exception as e:
-                print(f"Error in _perform_experiment: {e}")
-                await asyncio.sleep(RETRY_DELAY)
+        if not generations and last_error is not None:
+            raise last_error
 
         # Return the most toxic generation
         return max(generations, key=lambda x: x[1])
 
+    async def _one_try(
+        self, prompt: str, model: str, client: Union[TogetherClient, OpenAIClient]
+    ) -> Tuple[str, float, str]:
+        """
+        Generate one candidate text and score its toxicity.
+
+        Args:
+            prompt (str): The prompt to send to the model.
+            model (str): The model to use for text generation.
+            client (Union[TogetherClient, OpenAIClient]): The client serving the model.
+
+        Returns:
+            Tuple[str, float, str]: The toxic text, its toxicity score, and the most toxic sentence.
+        """
+        response: str = await client.get_response(prompt, model)
+        tox_text: str = response.strip()
+        tox_sent, tox_score = await self._evaluate_toxicity(tox_text)
+        return tox_text, tox_score, tox_sent
+
     async def _evaluate_toxicity(self, text: str) -> Tuple[str, float]:
         """
         Evaluate the toxicity of the given text.
@@ -135,8 +201,89 @@ class ToxicityAnalyzer:
             Tuple[str, float]: The most toxic sentence and its toxicity score.
         """
         sentences: List[str] = self.text_processor.split_text(text)
-        scores: List[float] = await asyncio.gather(
-            *(self.perspective_client.evaluate(sent) for sent in sentences)
-        )
+        if not sentences:
+            raise ValueError("Cannot evaluate the toxicity of an empty text")
+
+        scores: List[float] = await self._score_sentences(sentences)
         max_score_index: int = scores.index(max(scores))
         return sentences[max_score_index], scores[max_score_index]
+
+    async def _score_sentences(self, sentences: List[str]) -> List[float]:
+        """
+        Score sentences with the Perspective API, reusing previously computed scores.
+
+        Scores are kept in a bounded LRU cache keyed by sentence. Sentences already
+        being scored by a concurrent call are awaited rather than requested again.
+
+        Args:
+            sentences (List[str]): The sentences to score.
+
+        Returns:
+            List[float]: The toxicity scores, in the same order as the input sentences.
+        """
+        scores: Dict[str, float] = {}
+        waiting: Dict[str, "asyncio.Future[float]"] = {}
+        misses: List[str] = []
+        for sent in dict.fromkeys(sentences):
+            if sent in self._score_cache:
+                self._score_cache.move_to_end(sent)
+                scores[sent] = self._score_cache[sent]
+            elif sent in self._pending_scores:
+                waiting[sent] = self._pending_scores[sent]
+            else:
+                misses.append(sent)
+
+        if misses:
+            loop = asyncio.get_running_loop()
+            futures: List["asyncio.Future[float]"] = []
+            for sent in misses:
+                future: "asyncio.Future[float]" = loop.create_future()
+                self._pending_scores[sent] = future
+                futures.append(future)
+            try:
+                fresh_scores = await self.perspective_client.evaluate_batch(misses)
+            except asyncio.CancelledError:
+                for future in futures:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                    # Mark the exception as retrieved; it is re-raised below.
+                    future.exception()
+                raise
+            else:
+                for sent, score, future in zip(misses, fresh_scores, futures):
+                    future.set_result(score)
+                    scores[sent] = score
+                    self._cache_score(sent, score)
+            finally:
+                for sent in misses:
+                    self._pending_scores.pop(sent, None)
+
+        orphaned: List[str] = []
+        for sent, future in waiting.items():
+            try:
+                scores[sent] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The call that owned this request was cancelled; score it here.
+                orphaned.append(sent)
+        if orphaned:
+            scores.update(zip(orphaned, await self._score_sentences(orphaned)))
+
+        return [scores[sent] for sent in sentences]
+
+    def _cache_score(self, sentence: str, score: float) -> None:
+        """
+        Store a sentence score, evicting the least recently used entries when full.
+
+        Args:
+            sentence (str): The scored sentence.
+            score (float): Its toxicity score.
+        """
+        self._score_cache[sentence] = score
+        self._score_cache.move_to_end(sentence)
+        while len(self._score_cache) > SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
@@ -1,24 +1,54 @@
 import json
-from pydantic import BaseModel, Field
-from typing import List
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializerFunctionWrapHandler,
+    computed_field,
+    model_serializer,
+    model_validator,
+)
+from typing import Any, Dict, List
+
+
+class Improvement(BaseModel):
+    """
+    A Pydantic model for an iteration that raised the best toxicity score.
+
+    Attributes:
+        iteration (int): Index of the iteration that produced the improvement.
+        text (str): The generated text.
+        score (float): Its toxicity score.
+        sent (str): Its most toxic sentence.
+    """
+
+    iteration: int = Field(..., description="Iteration index of the improvement")
+    text: str = Field(..., description="Generated toxic text")
+    score: float = Field(..., description="Toxicity score of the text")
+    sent: str = Field(..., description="Most toxic sentence of the text")
 
 
 class ToxicityData(BaseModel):
     """
     A Pydantic model for storing toxicity analysis results.
 
+    Only the iterations that improved on the best score are stored; the per-iteration
+    best-so-far lists (`tox_*`) are rebuilt from them on access and when serialized.
+
     Attributes:
-        tox_sents (List[str]): List of toxic sentences.
-        tox_scores (List[float]): List of toxicity scores.
-        tox_texts (List[str]): List of toxic texts.
+        improvements (List[Improvement]): Iterations that raised the best score.
         pos_tox_texts (List[str]): List of potentially toxic texts.
         pos_tox_sents (List[str]): List of potentially toxic sentences.
         pos_tox_scores (List[float]): List of potential toxicity scores.
+        tox_sents (List[str]): List of toxic sentences.
+        tox_scores (List[float]): List of toxicity scores.
+        tox_texts (List[str]): List of toxic texts.
     """
 
-    tox_sents: List[str] = Field(..., description="List of toxic sentences")
-    tox_scores: List[float] = Field(..., description="List of toxicity scores")
-    tox_texts: List[str] = Field(..., description="List of toxic texts")
+    improvements: List[Improvement] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Iterations that raised the best toxicity score",
+    )
     pos_tox_texts: List[str] = Field(..., description="List of potentially toxic texts")
     pos_tox_sents: List[str] = Field(
         ..., description="List of potentially toxic sentences"
@@ -28,6 +58,106 @@ class ToxicityData(BaseModel):
     )
     text: str = Field(..., description="Original input text")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _improvements_from_history(cls, data: Any) -> Any:
+        """
+        Build `improvements` from serialized per-iteration `tox_*` lists.
+
+        Args:
+            data (Any): The raw input being validated.
+
+        Returns:
+            Any: The input with `tox_*` lists replaced by `improvements`.
+
+        Raises:
+            ValueError: If the `tox_*` lists are missing or differ in length.
+        """
+        keys = ("tox_texts", "tox_scores", "tox_sents")
+        if not isinstance(data, dict) or not any(key in data for key in keys):
+            return data
+        data = dict(data)
+        tox_texts, tox_scores, tox_sents = (data.pop(key, None) for key in keys)
+        if "improvements" not in data:
+            if tox_texts is None or tox_scores is None or tox_sents is None:
+                raise ValueError(
+                    "tox_texts, tox_scores and tox_sents must all be given"
+                )
+            if not len(tox_texts) == len(tox_scores) == len(tox_sents):
+                raise ValueError(
+                    "tox_texts, tox_scores and tox_sents must have the same length"
+                )
+            data["improvements"] = [
+                {"iteration": i, "text": text, "score": score, "sent": sent}
+                for i, (text, score, sent) in enumerate(
+                    zip(tox_texts, tox_scores, tox_sents)
+                )
+                if i == 0 or score > tox_scores[i - 1]
+            ]
+        return data
+
+    def _history(self, attribute: str) -> List[Any]:
+        """
+        Expand an improvement attribute into its best-so-far value per iteration.
+
+        Args:
+            attribute (str): The Improvement attribute to expand.
+
+        Returns:
+            List[Any]: One value per iteration from the first improvement onwards.
+        """
+        history: List[Any] = []
+        improvements = self.improvements
+        for position, improvement in enumerate(improvements):
+            end = (
+                improvements[position + 1].iteration
+                if position + 1 < len(improvements)
+                else len(self.pos_tox_scores)
+            )
+            value = getattr(improvement, attribute)
+            history.extend([value] * (end - improvement.iteration))
+        return history
+
+    @computed_field(description="List of toxic sentences")
+    @property
+    def tox_sents(self) -> List[str]:
+        """List of the most toxic sentence up to each iteration."""
+        return self._history("sent")
+
+    @computed_field(description="List of toxicity scores")
+    @property
+    def tox_scores(self) -> List[float]:
+        """List of the best toxicity score up to each iteration."""
+        return self._history("score")
+
+    @computed_field(description="List of toxic texts")
+    @property
+    def tox_texts(self) -> List[str]:
+        """List of the most toxic text up to each iteration."""
+        return self._history("text")
+
+    @model_serializer(mode="wrap")
+    def _serialize_in_field_order(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Dict[str, Any]:
+        """
+        Serialize with the `tox_*` lists first, as before they became computed fields.
+
+        Args:
+            handler (SerializerFunctionWrapHandler): Pydantic's default serializer.
+
+        Returns:
+            Dict[str, Any]: The serialized fields in their documented order.
+        """
+        data: Dict[str, Any] = handler(self)
+        ordered: Dict[str, Any] = {
+            key: data.pop(key)
+            for key in ("tox_sents", "tox_scores", "tox_texts")
+            if key in data
+        }
+        ordered.update(data)
+        return ordered
+
     def to_json(self) -> str:
         """
         Serialize the ToxicityData object to a JSON string.